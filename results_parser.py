@@ -1,11 +1,53 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import os
 import json
 import datetime
 import argparse
 import sys # For sys.exit
 import re # For regular expressions
+import heapq # For picking the earliest dates without sorting them all
+import itertools
+import mmap # For decoding large files straight from the page cache
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor # For parsing result files in parallel
+
+# Optional faster decoder; unlike json.loads it also accepts the memoryview of a mapped file (see _read_json_file).
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# ijson is optional: when installed, very large history files are decoded incrementally.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# History files at least this large are streamed through ijson (when installed) instead of
+# being read and decoded in one go, to bound memory use.
+_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Files at least this large are memory-mapped for orjson instead of being read into a bytes object.
+_MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Decoding errors raised by whichever JSON decoder reads the history files.
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
+
+# Pattern to capture symbol (group 1) and date components (groups 2, 3, 4 for Y, M, D)
+# in history keys. Compiled once at import, since it is applied to every history entry.
+_KEY_RE = re.compile(r"\(\s*'([^']*)'\s*,\s*datetime\.date\s*\(\s*(\d{4})\s*,\s*(\d{1,2})\s*,\s*(\d{1,2})\s*\)\s*\)")
+
+# Canonical datetime.date per (year, month, day) digit strings as captured by _KEY_RE,
+# or per ISO date string for "SYM|YYYY-MM-DD" keys.
+# A date repeats once per symbol and data type, so every occurrence shares one object
+# instead of allocating an equal copy, and the digits are only converted once.
+_DATE_CACHE = {}
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Parse result files from a specified directory.")
@@ -20,24 +62,43 @@ def parse_arguments():
 
 def parse_datetime_from_string_key(key_string):
     """
-    Parses a symbol and a datetime.date object from a string key like "('ticker', datetime.date(Y, M, D))".
+    Parses a symbol and a datetime.date object from a string key like "('ticker', datetime.date(Y, M, D))"
+    or "ticker|YYYY-MM-DD".
     Returns a tuple (symbol, datetime.date_object) or (None, None) if parsing fails.
     """
-    # Pattern to capture symbol (group 1) and date components (groups 2, 3, 4 for Y, M, D)
-    pattern = r"\(\s*'([^']*)'\s*,\s*datetime\.date\s*\(\s*(\d{4})\s*,\s*(\d{1,2})\s*,\s*(\d{1,2})\s*\)\s*\)"
-    match = re.search(pattern, key_string)
+    if '|' in key_string and not key_string.startswith('('):
+        # "SYM|YYYY-MM-DD" keys need no regex: the date part is decoded by the C fromisoformat.
+        symbol, iso_str = key_string.split('|', 1)
+        symbol = sys.intern(symbol)
+        date_obj = _DATE_CACHE.get(iso_str)
+        if date_obj is not None:
+            return symbol, date_obj
+        try:
+            date_obj = datetime.date.fromisoformat(iso_str)
+        except ValueError:
+            return None, None
+        _DATE_CACHE[iso_str] = date_obj
+        return symbol, date_obj
+
+    match = _KEY_RE.search(key_string)
 
     if match:
-        symbol = match.group(1)
-        year_str, month_str, day_str = match.group(2), match.group(3), match.group(4)
+        symbol, year_str, month_str, day_str = match.groups()
+        # The same symbol repeats on every row: interning shares one string object,
+        # so the dict lookups on it in parse_history_file hit the identity fast path.
+        symbol = sys.intern(symbol)
+        date_key = (year_str, month_str, day_str)
+        date_obj = _DATE_CACHE.get(date_key)
+        if date_obj is not None:
+            return symbol, date_obj
         try:
             year = int(year_str)
             month = int(month_str)
             day = int(day_str)
             date_obj = datetime.date(year, month, day)
+            _DATE_CACHE[date_key] = date_obj
             return symbol, date_obj
-        except ValueError as e:
-            print(f"Error parsing date components from key '{key_string}': year={year_str}, month={month_str}, day={day_str}. Error: {e}")
+        except ValueError: # Out-of-range date; the caller counts and reports skipped keys
             return None, None
     else:
         # print(f"Warning: Could not find symbol/date pattern in key: '{key_string}'") # Can be noisy
@@ -46,31 +107,262 @@ def parse_datetime_from_string_key(key_string):
 def identify_files(directory_path):
     """
     Identifies '_history.json' files and other '.json' files in the specified directory.
+    The caller validates directory_path; if it is not a readable directory, os.scandir's error is reported below.
     Returns a tuple: (history_files_list, other_json_files_list)
     """
     history_files = []
     other_json_files = []
     try:
-        if not os.path.isdir(directory_path): # Redundant check if called after main's check, but good for standalone use
-            print(f"Error in identify_files: Directory not found at path: {directory_path}")
-            return history_files, other_json_files
-
-        for entry in os.listdir(directory_path):
-            full_path = os.path.join(directory_path, entry)
-            if os.path.isfile(full_path):
-                if entry.endswith("_history.json"):
-                    history_files.append(full_path)
-                elif entry.endswith(".json"):
-                    other_json_files.append(full_path)
-    except FileNotFoundError: # Should not happen if directory_path is validated before call
-        print(f"Error in identify_files: Path not found {directory_path} during listdir. This should not happen if path was pre-validated.")
-        return [], [] # Return empty lists
+        # scandir entries carry the file type reported by the directory listing itself,
+        # so is_file() only needs a stat() call for symlinks.
+        with os.scandir(directory_path) as it:
+            for entry in it:
+                if entry.is_file():
+                    name = entry.name
+                    if name.endswith("_history.json"):
+                        history_files.append(entry.path)
+                    elif name.endswith(".json"):
+                        other_json_files.append(entry.path)
     except Exception as e:
         print(f"An unexpected error occurred in identify_files: {e}")
         return [], [] # Return empty lists in case of other errors
 
     return history_files, other_json_files
 
+def print_data_summary(all_history_data, total_history_items, all_other_data,
+                       num_history_files_processed, num_other_files_processed):
+    """
+    Prints a summary of the aggregated history and other JSON data.
+    The report is collected as lines and written to stdout in one call.
+    all_history_data is keyed by (symbol, data_type_key); it is grouped by symbol here, in first-seen order.
+    """
+    history_by_symbol = {}
+    for (symbol, data_type_key), type_data_dict in all_history_data.items():
+        history_by_symbol.setdefault(symbol, []).append((data_type_key, type_data_dict))
+
+    lines = []
+    lines.append("\n======= Data Summary =======")
+    lines.append(f"\n--- History Data ---")
+    lines.append(f"Successfully processed {num_history_files_processed} history files.")
+    lines.append(f"Found {len(history_by_symbol)} unique symbols in history data, with a total of {total_history_items} data items (date entries).")
+
+    max_symbols_to_print = 3
+    max_entries_per_type = 2
+
+    for i, (symbol, symbol_data) in enumerate(history_by_symbol.items()):
+        if i >= max_symbols_to_print:
+            lines.append(f"... and {len(history_by_symbol) - max_symbols_to_print} more symbols.")
+            break
+        lines.append(f"\n  Symbol: {symbol}")
+        for data_type_key, type_data_dict in symbol_data:
+            lines.append(f"    {data_type_key}:")
+            # Earliest dates first for consistent sample output. Only the printed entries are
+            # selected (heap of size max_entries_per_type), instead of sorting every date.
+            # Ensure type_data_dict is actually a dict and keys are sortable (datetime.date)
+            try:
+                sorted_dates = heapq.nsmallest(max_entries_per_type, type_data_dict.keys())
+            except TypeError: # Handle cases where keys might not be date objects if parsing error occurred upstream
+                lines.append(f"      Could not sort dates for {data_type_key} (unexpected key types).")
+                # Print unsorted or skip
+                sorted_dates = list(type_data_dict.keys())[:max_entries_per_type] # Attempt to get keys anyway
+
+            for date_obj in sorted_dates:
+                lines.append(f"      {date_obj}: {type_data_dict[date_obj]}")
+            if len(type_data_dict) > max_entries_per_type:
+                lines.append(f"      ... and {len(type_data_dict) - max_entries_per_type} more entries for {data_type_key}.")
+
+    lines.append(f"\n--- Other JSON Data ---")
+    lines.append(f"Successfully processed {num_other_files_processed} other JSON files.")
+    lines.append(f"Found {len(all_other_data)} unique symbols in other JSON data.")
+
+    for i, (symbol, details_dict) in enumerate(all_other_data.items()):
+        if i >= max_symbols_to_print: # Use the same limit for symbols
+            lines.append(f"... and {len(all_other_data) - max_symbols_to_print} more symbols.")
+            break
+        lines.append(f"\n  Symbol: {symbol}")
+        # Print a few selected details
+        if 'summaryDetail' in details_dict and isinstance(details_dict['summaryDetail'], dict):
+            sd = details_dict['summaryDetail']
+            lines.append(f"    Summary Detail:")
+            lines.append(f"      Previous Close: {sd.get('previousClose', 'N/A')}")
+            lines.append(f"      Open: {sd.get('open', 'N/A')}")
+            lines.append(f"      Volume: {sd.get('volume', 'N/A')}")
+        if 'quoteType' in details_dict and isinstance(details_dict['quoteType'], dict):
+            qt = details_dict['quoteType']
+            lines.append(f"    Quote Type:")
+            lines.append(f"      Short Name: {qt.get('shortName', 'N/A')}")
+            lines.append(f"      Exchange: {qt.get('exchange', 'N/A')}")
+    lines.append("\n==========================")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _iter_json_object_items(f):
+    """
+    Yields the top-level (key, value) pairs of the JSON object in the binary file f.
+    Files of _STREAM_THRESHOLD_BYTES or more are decoded incrementally with ijson when it
+    is installed, so only one top-level value is held in memory at a time; everything
+    else is read at once and decoded with _json_loads, which is faster.
+    Raises TypeError with either decoder if the top-level value is not an object.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if ijson is not None and size >= _STREAM_THRESHOLD_BYTES:
+        events = ijson.parse(f, use_float=True)
+        first_event = next(events)
+        if first_event[1] != 'start_map':
+            raise TypeError(f"expected a JSON object at the top level, got '{first_event[1]}'")
+        return ijson.kvitems(itertools.chain([first_event], events), '')
+    raw_data = _read_json_file(f, size)
+    if not isinstance(raw_data, dict):
+        raise TypeError(f"expected a JSON object at the top level, got {type(raw_data).__name__}")
+    return raw_data.items()
+
+def _read_json_file(f, size):
+    """
+    Decodes the whole JSON document in the binary file f, which is size bytes long.
+    With orjson, files of _MMAP_THRESHOLD_BYTES or more are memory-mapped and decoded through a
+    memoryview, so the decoder reads the page cache directly instead of a second, in-process copy
+    of the file. json.loads cannot take a memoryview, and for small files a plain read is cheaper.
+    """
+    if orjson is not None and size >= _MMAP_THRESHOLD_BYTES:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The view must be released before the map is closed, or closing raises BufferError
+            with memoryview(mm) as view:
+                return _json_loads(view)
+    return _json_loads(f.read())
+
+def _aggregate_rows(data_type_key: str, data_dict: dict[str, object],
+                    parsed_data: dict[tuple[str, str], dict[datetime.date, object]],
+                    datetime_parser_func: Callable[[str], tuple[str | None, datetime.date | None]],
+                    parsed_keys: dict[str, tuple[str | None, datetime.date | None]]) -> int:
+    """
+    Adds the rows of one data type of a history file to parsed_data and returns the number of rows added
+    (rows with unparseable keys are skipped). parsed_keys memoizes datetime_parser_func across the file's data types.
+    """
+    items_added = 0
+    for key_string, value in data_dict.items():
+        parsed_key = parsed_keys.get(key_string)
+        if parsed_key is None:
+            parsed_key = datetime_parser_func(key_string)
+            parsed_keys[key_string] = parsed_key
+        symbol, date_obj = parsed_key
+        if symbol and date_obj:
+            parsed_data[(symbol, data_type_key)][date_obj] = value
+            items_added += 1
+    return items_added
+
+def parse_history_file(file_path, datetime_parser_func):
+    """
+    Parses a single _history.json file.
+    Returns a tuple (parsed_data, symbol_count, item_count) or (None, 0, 0) on failure.
+    parsed_data format: {(symbol, data_type_key): {datetime.date_obj: value}}
+    """
+    # One flat level keyed by (symbol, data_type_key); missing entries are created on first access.
+    parsed_data = defaultdict(dict)
+    parsed_keys = {} # key string -> (symbol, date), shared by all data types of the file
+    items_in_file = 0
+    skipped_in_file = 0 # Rows with unparseable keys, reported in a single warning
+
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        print(f"Error: History file not found at '{file_path}'")
+        return None, 0, 0
+    except Exception as e:
+        print(f"An unexpected error occurred opening or reading '{file_path}': {e}")
+        return None, 0, 0
+
+    with f:
+        try:
+            # Each data type is aggregated as soon as it has been decoded (see _iter_json_object_items).
+            for data_type_key, data_dict in _iter_json_object_items(f):
+                data_type_key = sys.intern(data_type_key)
+                if not isinstance(data_dict, dict):
+                    print(f"Warning: Expected a dictionary for data_type_key '{data_type_key}' in '{file_path}', got {type(data_dict)}. Skipping.")
+                    continue
+                items_added = _aggregate_rows(data_type_key, data_dict, parsed_data, datetime_parser_func, parsed_keys)
+                items_in_file += items_added
+                skipped_in_file += len(data_dict) - items_added
+        except _JSON_ERRORS:
+            print(f"Error: Could not decode JSON from '{file_path}'. Please check its format.")
+            return None, 0, 0
+        except Exception as e:
+            print(f"An unexpected error occurred opening or reading '{file_path}': {e}")
+            return None, 0, 0
+
+    if skipped_in_file:
+        print(f"Warning: Could not parse the keys of {skipped_in_file} entries in file '{file_path}'. Skipped these entries.")
+
+    return dict(parsed_data), len({symbol for symbol, _ in parsed_data}), items_in_file
+
+def _parse_history_worker(file_path):
+    """
+    Parses one history file with the default key parser.
+    Defined at module level so that it can be sent to worker processes.
+    """
+    return parse_history_file(file_path, parse_datetime_from_string_key)
+
+def _map_files(parse_func, file_paths):
+    """
+    Applies parse_func to every path in file_paths and returns the results in the same order.
+    Files are independent of each other, so they are spread over a process pool when more than
+    one worker would run; otherwise they are parsed in this process, avoiding the cost of workers.
+    """
+    workers = min(len(file_paths), os.cpu_count() or 1)
+    if workers <= 1:
+        return [parse_func(path) for path in file_paths]
+    # Files are mostly small, so send them in chunks (about 4 per worker) rather than one per round trip.
+    chunksize = len(file_paths) // (workers * 4) or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_func, file_paths, chunksize=chunksize))
+
+def parse_other_json_file(file_path):
+    """
+    Parses a single 'other' JSON file, expecting a specific structure: [["symbol", {details_dict}]].
+    Returns a tuple (symbol, details_dict) or None on failure.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw_data = _read_json_file(f, os.fstat(f.fileno()).st_size)
+    except FileNotFoundError:
+        print(f"Error: Other JSON file not found at '{file_path}'")
+        return None
+    except json.JSONDecodeError:
+        print(f"Error: Could not decode JSON from '{file_path}'. Please check its format.")
+        return None
+    except Exception as e:
+        print(f"An unexpected error occurred opening or reading '{file_path}': {e}")
+        return None
+
+    try:
+        if not isinstance(raw_data, list) or not raw_data:
+            print(f"Error: Expected a non-empty list in {os.path.basename(file_path)}, got {type(raw_data)}")
+            return None
+
+        inner_list = raw_data[0]
+        if not isinstance(inner_list, list) or len(inner_list) < 2:
+            print(f"Error: Expected a non-empty inner list with at least 2 elements in {os.path.basename(file_path)}")
+            return None
+
+        symbol = inner_list[0]
+        details_dict = inner_list[1]
+
+        if not isinstance(symbol, str):
+            print(f"Error: Expected symbol to be a string in {os.path.basename(file_path)}, got {type(symbol)}")
+            return None
+
+        if not isinstance(details_dict, dict):
+            print(f"Error: Expected details to be a dictionary in {os.path.basename(file_path)}, got {type(details_dict)}")
+            return None
+
+        return (symbol, details_dict)
+
+    except (IndexError, TypeError) as e:
+        print(f"Error: Unexpected JSON structure in file '{os.path.basename(file_path)}'. {e}")
+        return None
+    except Exception as e: # Catch any other unexpected error during structure validation
+        print(f"An unexpected error occurred during structure validation of '{os.path.basename(file_path)}': {e}")
+        return None
+
 if __name__ == "__main__":
     args = parse_arguments()
     print(f"Results directory specified: {args.dir}")
@@ -95,6 +387,8 @@ if __name__ == "__main__":
     test_key_malformed_int_error = "('BADINT', datetime.date(2023, 12, XX))"
     test_key_no_date = "('NODATE', 123)"
     test_key_only_symbol = "('SYMBOL_ONLY', )" # Test case for regex robustness
+    test_key_iso = "MSFT|2023-12-25" # Test case for the pipe-separated ISO key format
+    test_key_iso_invalid = "ERR|2023-02-30"
 
     results = [
         parse_datetime_from_string_key(test_key1),
@@ -104,8 +398,10 @@ if __name__ == "__main__":
         parse_datetime_from_string_key(test_key_malformed_int_error),
         parse_datetime_from_string_key(test_key_no_date),
         parse_datetime_from_string_key(test_key_only_symbol),
+        parse_datetime_from_string_key(test_key_iso),
+        parse_datetime_from_string_key(test_key_iso_invalid),
     ]
-    test_keys = [test_key1, test_key2, test_key_invalid_date, test_key_malformed_regex_no_match, test_key_malformed_int_error, test_key_no_date, test_key_only_symbol]
+    test_keys = [test_key1, test_key2, test_key_invalid_date, test_key_malformed_regex_no_match, test_key_malformed_int_error, test_key_no_date, test_key_only_symbol, test_key_iso, test_key_iso_invalid]
 
     for key_str, result_tuple in zip(test_keys, results):
         if result_tuple and result_tuple[0] is not None and result_tuple[1] is not None:
@@ -117,10 +413,8 @@ if __name__ == "__main__":
 
     # --- Parsing History Files ---
     print("\n--- Parsing History Files ---")
-    all_history_data = {}
+    all_history_data = defaultdict(dict) # (symbol, data_type_key) -> {date: value}, created on first access while merging
     # total_history_symbols_overall = set() # Replaced by len(all_history_data) later
-    total_history_items_overall = 0
-    successfully_processed_history_files = 0 # Initialize counter for history files
 
     # Create dummy history files for testing if no files are identified
     # This part is for local testing; normally, history_files would come from identify_files()
@@ -165,27 +459,23 @@ if __name__ == "__main__":
     if not history_files:
         print("No history files found or created to parse.")
 
-    for hf_path in history_files:
-        print(f"Parsing history file: {hf_path}")
-        parsed_data_from_file, sym_count_in_file, item_count_in_file = parse_history_file(hf_path, parse_datetime_from_string_key)
-
+    history_results = []
+    for hf_path, history_result in zip(history_files, _map_files(_parse_history_worker, history_files)):
+        print(f"Parsed history file: {hf_path}")
+        parsed_data_from_file, sym_count_in_file, item_count_in_file = history_result
         if parsed_data_from_file is not None:
             print(f"  Loaded {sym_count_in_file} symbols and {item_count_in_file} data items from {os.path.basename(hf_path)}")
-
-            for symbol, symbol_data in parsed_data_from_file.items():
-                if symbol not in all_history_data:
-                    all_history_data[symbol] = {}
-
-                for data_type_key, type_data_dict in symbol_data.items():
-                    if data_type_key not in all_history_data[symbol]:
-                        all_history_data[symbol][data_type_key] = {}
-                    all_history_data[symbol][data_type_key].update(type_data_dict)
-
-            total_history_items_overall += item_count_in_file
-            successfully_processed_history_files += 1 # Increment counter
+            history_results.append(history_result)
         else:
             print(f"  Failed to parse {os.path.basename(hf_path)}")
 
+    # The counts follow from the successful results, which are then merged in one pass
+    successfully_processed_history_files = len(history_results)
+    total_history_items_overall = sum(item_count for _, _, item_count in history_results)
+    for parsed_data_from_file, _, _ in history_results:
+        for symbol_type_key, type_data_dict in parsed_data_from_file.items():
+            all_history_data[symbol_type_key].update(type_data_dict)
+
     # Removed summary prints here, will be done by print_data_summary
     # print(f"Finished parsing history files.")
     # print(f"Total unique symbols from history files: {len(all_history_data)}. Total items processed: {total_history_items_overall}.")
@@ -195,7 +485,6 @@ if __name__ == "__main__":
     # --- Parsing Other JSON Files ---
     print("\n--- Parsing Other JSON Files ---")
     all_other_data = {}
-    successfully_parsed_other_files = 0 # Renamed for clarity and initialized
 
     # Create dummy other JSON files for testing if no files are identified
     # total_other_symbols_loaded will effectively be the count of successfully parsed files
@@ -228,18 +517,18 @@ if __name__ == "__main__":
     if not other_json_files:
         print("No other JSON files found or created to parse.")
 
-    for ojf_path in other_json_files:
-        print(f"Parsing other JSON file: {ojf_path}")
-        parsed_content = parse_other_json_file(ojf_path)
-
+    other_results = []
+    for ojf_path, parsed_content in zip(other_json_files, _map_files(parse_other_json_file, other_json_files)):
+        print(f"Parsed other JSON file: {ojf_path}")
         if parsed_content:
-            symbol, details_dict = parsed_content
-            all_other_data[symbol] = details_dict
-            print(f"  Loaded data for symbol '{symbol}' from {os.path.basename(ojf_path)}")
-            successfully_parsed_other_files +=1
+            print(f"  Loaded data for symbol '{parsed_content[0]}' from {os.path.basename(ojf_path)}")
+            other_results.append(parsed_content)
         else:
             print(f"  Failed to parse or validate structure of {os.path.basename(ojf_path)}")
 
+    successfully_parsed_other_files = len(other_results)
+    all_other_data.update(other_results) # (symbol, details_dict) pairs; later files win, as before
+
     # Removed summary prints here, will be done by print_data_summary
     # print(f"Finished parsing other JSON files. Successfully processed {successfully_parsed_other_files} files.")
     # print(f"Total unique symbols loaded from other files: {len(all_other_data)}")
@@ -250,154 +539,3 @@ if __name__ == "__main__":
                        successfully_processed_history_files,
                        successfully_parsed_other_files)
     pass
-
-def print_data_summary(all_history_data, total_history_items, all_other_data,
-                       num_history_files_processed, num_other_files_processed):
-    """
-    Prints a summary of the aggregated history and other JSON data.
-    """
-    print("\n======= Data Summary =======")
-    print(f"\n--- History Data ---")
-    print(f"Successfully processed {num_history_files_processed} history files.")
-    print(f"Found {len(all_history_data)} unique symbols in history data, with a total of {total_history_items} data items (date entries).")
-
-    max_symbols_to_print = 3
-    max_entries_per_type = 2
-
-    for i, (symbol, symbol_data) in enumerate(all_history_data.items()):
-        if i >= max_symbols_to_print:
-            print(f"... and {len(all_history_data) - max_symbols_to_print} more symbols.")
-            break
-        print(f"\n  Symbol: {symbol}")
-        for data_type_key, type_data_dict in symbol_data.items():
-            print(f"    {data_type_key}:")
-            # Sort by date for consistent sample output
-            # Ensure type_data_dict is actually a dict and keys are sortable (datetime.date)
-            try:
-                sorted_dates = sorted(type_data_dict.keys())
-            except TypeError: # Handle cases where keys might not be date objects if parsing error occurred upstream
-                print(f"      Could not sort dates for {data_type_key} (unexpected key types).")
-                # Print unsorted or skip
-                sorted_dates = list(type_data_dict.keys()) # Attempt to get keys anyway
-
-            for entry_idx, date_obj in enumerate(sorted_dates):
-                if entry_idx >= max_entries_per_type:
-                    print(f"      ... and {len(type_data_dict) - max_entries_per_type} more entries for {data_type_key}.")
-                    break
-                print(f"      {date_obj}: {type_data_dict[date_obj]}")
-
-    print(f"\n--- Other JSON Data ---")
-    print(f"Successfully processed {num_other_files_processed} other JSON files.")
-    print(f"Found {len(all_other_data)} unique symbols in other JSON data.")
-
-    for i, (symbol, details_dict) in enumerate(all_other_data.items()):
-        if i >= max_symbols_to_print: # Use the same limit for symbols
-            print(f"... and {len(all_other_data) - max_symbols_to_print} more symbols.")
-            break
-        print(f"\n  Symbol: {symbol}")
-        # Print a few selected details
-        if 'summaryDetail' in details_dict and isinstance(details_dict['summaryDetail'], dict):
-            sd = details_dict['summaryDetail']
-            print(f"    Summary Detail:")
-            print(f"      Previous Close: {sd.get('previousClose', 'N/A')}")
-            print(f"      Open: {sd.get('open', 'N/A')}")
-            print(f"      Volume: {sd.get('volume', 'N/A')}")
-        if 'quoteType' in details_dict and isinstance(details_dict['quoteType'], dict):
-            qt = details_dict['quoteType']
-            print(f"    Quote Type:")
-            print(f"      Short Name: {qt.get('shortName', 'N/A')}")
-            print(f"      Exchange: {qt.get('exchange', 'N/A')}")
-    print("\n==========================")
-
-
-def parse_history_file(file_path, datetime_parser_func):
-    """
-    Parses a single _history.json file.
-    Returns a tuple (parsed_data, symbol_count, item_count) or (None, 0, 0) on failure.
-    parsed_data format: {symbol: {data_type_key: {datetime.date_obj: value}}}
-    """
-    parsed_data = {}
-    symbols_in_file = set()
-    items_in_file = 0
-
-    try:
-        with open(file_path, 'r') as f:
-            raw_data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: History file not found at '{file_path}'")
-        return None, 0, 0
-    except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from '{file_path}'. Please check its format.")
-        return None, 0, 0
-    except Exception as e:
-        print(f"An unexpected error occurred opening or reading '{file_path}': {e}")
-        return None, 0, 0
-
-    for data_type_key, data_dict in raw_data.items():
-        if not isinstance(data_dict, dict):
-            print(f"Warning: Expected a dictionary for data_type_key '{data_type_key}' in '{file_path}', got {type(data_dict)}. Skipping.")
-            continue
-        for key_string, value in data_dict.items():
-            symbol, date_obj = datetime_parser_func(key_string)
-            if symbol and date_obj:
-                if symbol not in parsed_data:
-                    parsed_data[symbol] = {}
-                symbols_in_file.add(symbol)
-
-                if data_type_key not in parsed_data[symbol]:
-                    parsed_data[symbol][data_type_key] = {}
-
-                parsed_data[symbol][data_type_key][date_obj] = value
-                items_in_file += 1
-            else:
-                print(f"Warning: Could not parse key '{key_string}' in file '{file_path}'. Skipping this entry.")
-
-    return parsed_data, len(symbols_in_file), items_in_file
-
-def parse_other_json_file(file_path):
-    """
-    Parses a single 'other' JSON file, expecting a specific structure: [["symbol", {details_dict}]].
-    Returns a tuple (symbol, details_dict) or None on failure.
-    """
-    try:
-        with open(file_path, 'r') as f:
-            raw_data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: Other JSON file not found at '{file_path}'")
-        return None
-    except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from '{file_path}'. Please check its format.")
-        return None
-    except Exception as e:
-        print(f"An unexpected error occurred opening or reading '{file_path}': {e}")
-        return None
-
-    try:
-        if not isinstance(raw_data, list) or not raw_data:
-            print(f"Error: Expected a non-empty list in {os.path.basename(file_path)}, got {type(raw_data)}")
-            return None
-
-        inner_list = raw_data[0]
-        if not isinstance(inner_list, list) or len(inner_list) < 2:
-            print(f"Error: Expected a non-empty inner list with at least 2 elements in {os.path.basename(file_path)}")
-            return None
-
-        symbol = inner_list[0]
-        details_dict = inner_list[1]
-
-        if not isinstance(symbol, str):
-            print(f"Error: Expected symbol to be a string in {os.path.basename(file_path)}, got {type(symbol)}")
-            return None
-
-        if not isinstance(details_dict, dict):
-            print(f"Error: Expected details to be a dictionary in {os.path.basename(file_path)}, got {type(details_dict)}")
-            return None
-
-        return (symbol, details_dict)
-
-    except (IndexError, TypeError) as e:
-        print(f"Error: Unexpected JSON structure in file '{os.path.basename(file_path)}'. {e}")
-        return None
-    except Exception as e: # Catch any other unexpected error during structure validation
-        print(f"An unexpected error occurred during structure validation of '{os.path.basename(file_path)}': {e}")
-        return None